@@ -1,23 +1,75 @@
+import base64
+import hashlib
+import hmac
 import os
+import smtplib
+import sqlite3
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from types import SimpleNamespace
+import bcrypt
+import click
+import orjson
+from flask import Blueprint, Flask, render_template, request, redirect, url_for, flash, session, jsonify, abort
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import load_only, raiseload
 from flask_mail import Mail, Message
+from flask_caching import Cache
+from flask_wtf import FlaskForm
+from wtforms import StringField, TextAreaField
+from wtforms.validators import DataRequired, Email, Length, Optional, Regexp
 from dotenv import load_dotenv
 from twilio.rest import Client as TwilioClient
+from twilio.http.http_client import TwilioHttpClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from celery import Celery, Task
+from celery.signals import worker_process_shutdown
+from kombu.exceptions import OperationalError
 
 # Load .env
 load_dotenv()
 
+# JSON responses via orjson (faster, serializes datetimes natively)
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        # OPT_NON_STR_KEYS: accept int/etc. dict keys like Flask's default provider
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret')
 
 # Database (SQLite)
 db_url = os.getenv('DATABASE_URL', 'sqlite:///admissions.db')
 app.config['SQLALCHEMY_DATABASE_URI'] = db_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if db_url.startswith('sqlite'):
+    # Let pooled connections move between request threads
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'check_same_thread': False}}
+else:
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
 db = SQLAlchemy(app)
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a registration is being written
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+
 # Mail config
 app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER')
 app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 25))
@@ -26,6 +78,26 @@ app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
 app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
 mail = Mail(app)
 
+# Cache (Redis when configured, in-process otherwise; the in-process cache is
+# per worker, so invalidation there only clears the current worker)
+cache_redis_url = os.getenv('CACHE_REDIS_URL')
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache' if cache_redis_url else 'SimpleCache',
+    'CACHE_REDIS_URL': cache_redis_url,
+})
+
+# Share compiled template bytecode across workers and restarts
+# (auto_reload already follows TEMPLATES_AUTO_RELOAD / debug mode)
+jinja_cache_dir = os.getenv('JINJA_CACHE_DIR')
+if jinja_cache_dir:
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+
+# Email templates, one per action: compiled once and rendered directly
+with app.app_context():
+    EMAIL_TMPLS = {action: app.jinja_env.get_template(f'email_{action}.html')
+                   for action in ('received', 'approved', 'rejected')}
+
 # Twilio config (optional)
 TWILIO_SID = os.getenv('TWILIO_ACCOUNT_SID')
 TWILIO_AUTH = os.getenv('TWILIO_AUTH_TOKEN')
@@ -33,14 +105,36 @@ TWILIO_FROM = os.getenv('TWILIO_FROM')
 twilio_client = None
 if TWILIO_SID and TWILIO_AUTH:
     try:
-        twilio_client = TwilioClient(TWILIO_SID, TWILIO_AUTH)
+        # Keep TLS connections to the Twilio API alive across sends
+        twilio_http = TwilioHttpClient(pool_connections=True)
+        twilio_http.session.mount('https://', HTTPAdapter(
+            pool_connections=10, pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.2)))
+        twilio_client = TwilioClient(TWILIO_SID, TWILIO_AUTH, http_client=twilio_http)
     except Exception:
         twilio_client = None
 
+# SMS bodies, formatted in the worker. The name is trimmed so the body fits in
+# SMS_MAX_LENGTH characters without losing the application ID.
+SMS_MAX_LENGTH = 160
+SMS_TEMPLATES = {
+    'received': "Hi {full_name}, we received your application. ID: {id}",
+    'approved': "Congratulations {full_name}! Your application (ID:{id}) is approved.",
+    'rejected': "Hello {full_name}, your application (ID:{id}) status: rejected.",
+}
+
 # Simple Admin creds (for demo). For production use a proper auth system.
 ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'admin')
 ADMIN_PASSWORD = os.getenv('ADMIN_PASSWORD', 'adminpass')
 
+# bcrypt only accepts 72 bytes, so passwords are SHA-256 pre-hashed (base64, no NUL bytes)
+def password_digest(password):
+    return base64.b64encode(hashlib.sha256(password.encode()).digest())
+
+# Hashed once at startup so logins never compare the plaintext
+ADMIN_PASSWORD_HASH = bcrypt.hashpw(password_digest(ADMIN_PASSWORD), bcrypt.gensalt(rounds=12))
+ADMIN_PAGE_SIZE = 50  # rows per admin list page
+
 # Models
 class Applicant(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -52,37 +146,127 @@ class Applicant(db.Model):
     status = db.Column(db.String(20), default='pending')  # pending / approved / rejected
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     admin_note = db.Column(db.Text, nullable=True)
+    # Declare relationships with lazy='raise' and selectinload them where needed
+
+    __table_args__ = (
+        db.Index('ix_applicant_status_created', 'status', 'created_at'),
+        db.Index('ix_applicant_created', 'created_at'),
+    )
 
     def __repr__(self):
         return f'<Applicant {self.id} {self.full_name} ({self.status})>'
 
-# Helpers: send email
-def send_email(subject, recipient, html_body):
+# Columns shown by the admin lists (address is never displayed there)
+ADMIN_LIST_COLUMNS = (Applicant.id, Applicant.full_name, Applicant.email, Applicant.phone,
+                      Applicant.course, Applicant.status, Applicant.created_at)
+
+# Forms
+def strip_or_none(value):
+    return (value.strip() or None) if value else None
+
+class RegisterForm(FlaskForm):
+    full_name = StringField('Full name', filters=[strip_or_none],
+                            validators=[DataRequired('Name is required.'), Length(max=200)])
+    email = StringField('Email', filters=[strip_or_none],
+                        validators=[DataRequired('Email is required.'), Email(), Length(max=200)])
+    phone = StringField('Phone', filters=[strip_or_none],
+                        validators=[Optional(), Length(max=20),
+                                    Regexp(r'^\+?[0-9 ()-]{7,20}$', message='Invalid phone number.')])
+    course = StringField('Course', filters=[strip_or_none], validators=[Optional(), Length(max=100)])
+    address = TextAreaField('Address', filters=[strip_or_none], validators=[Optional()])
+
+# Celery (background email/SMS). Without a broker, tasks run inline.
+class FlaskTask(Task):
+    def __call__(self, *args, **kwargs):
+        with app.app_context():
+            return self.run(*args, **kwargs)
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # final failure (after retries), also when running eagerly in the web process
+        app.logger.exception("Task %s failed: %s", self.name, exc, exc_info=exc)
+
+celery_broker_url = os.getenv('CELERY_BROKER_URL')
+celery_app = Celery('admissions', broker=celery_broker_url, task_cls=FlaskTask)
+celery_app.conf.task_always_eager = not celery_broker_url
+celery_app.conf.task_routes = {
+    'admissions.send_email': {'queue': 'email'},
+    'admissions.send_sms': {'queue': 'sms'},
+}
+
+# SMTP session kept open per worker process and reused across email tasks
+smtp_connection = None
+
+def get_smtp_connection():
+    global smtp_connection
+    if smtp_connection is None:
+        smtp_connection = mail.connect().__enter__()
+    return smtp_connection
+
+def close_smtp_connection():
+    global smtp_connection
+    if smtp_connection is not None:
+        try:
+            smtp_connection.__exit__(None, None, None)
+        except (smtplib.SMTPException, OSError):
+            pass
+        smtp_connection = None
+
+@worker_process_shutdown.connect
+def close_smtp_on_shutdown(**kwargs):
+    close_smtp_connection()
+
+# Tasks: send email
+@celery_app.task(name='admissions.send_email', bind=True,
+                 autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def send_email_task(self, subject, recipient, html_body):
     if not app.config.get('MAIL_SERVER'):
         app.logger.warning("Mail server not configured — skipping email.")
         return False
-    try:
-        msg = Message(subject=subject, recipients=[recipient], html=html_body,
-                      sender=app.config.get('MAIL_USERNAME'))
+    msg = Message(subject=subject, recipients=[recipient], html=html_body,
+                  sender=app.config.get('MAIL_USERNAME'))
+    if celery_app.conf.task_always_eager:
+        # running inline in the web process: no long-lived session
         mail.send(msg)
-        app.logger.info(f"Email sent to {recipient}")
-        return True
-    except Exception as e:
-        app.logger.exception("Failed to send email: %s", e)
-        return False
-
-# Helpers: send sms (twilio)
-def send_sms(to_number, body):
+    else:
+        try:
+            get_smtp_connection().send(msg)
+        except smtplib.SMTPServerDisconnected:
+            # idle session dropped by the server; reconnect once
+            close_smtp_connection()
+            get_smtp_connection().send(msg)
+    app.logger.info(f"Email sent to {recipient}")
+    return True
+
+# Tasks: send sms (twilio)
+@celery_app.task(name='admissions.send_sms', bind=True,
+                 autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def send_sms_task(self, to_number, action, fields):
     if not twilio_client or not TWILIO_FROM:
         app.logger.warning("Twilio not configured — skipping SMS.")
         return False
+    template = SMS_TEMPLATES[action]
+    budget = SMS_MAX_LENGTH - len(template.format_map({**fields, 'full_name': ''}))
+    body = template.format_map({**fields, 'full_name': fields['full_name'][:max(budget, 0)]})
+    message = twilio_client.messages.create(body=body, from_=TWILIO_FROM, to=to_number)
+    app.logger.info("SMS sent SID: %s", message.sid)
+    return True
+
+# Notifications are best-effort: a broker outage must not fail a request
+# whose DB commit already succeeded
+def enqueue(task, *args):
+    if celery_app.conf.task_always_eager:
+        # inline in the web process: one attempt, no back-to-back autoretries
+        task.apply(args, retries=task.max_retries)
+        return
     try:
-        message = twilio_client.messages.create(body=body, from_=TWILIO_FROM, to=to_number)
-        app.logger.info("SMS sent SID: %s", message.sid)
-        return True
-    except Exception as e:
-        app.logger.exception("Failed to send SMS: %s", e)
-        return False
+        task.delay(*args)
+    except OperationalError as e:
+        app.logger.exception("Failed to enqueue %s: %s", task.name, e)
+
+@cache.memoize(timeout=15)
+def get_status_counts():
+    return dict(db.session.query(Applicant.status, func.count(Applicant.id))
+                .group_by(Applicant.status).all())
 
 # Routes
 @app.route('/')
@@ -91,132 +275,214 @@ def index():
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
-    if request.method == 'POST':
-        full_name = request.form.get('full_name')
-        email = request.form.get('email')
-        phone = request.form.get('phone')
-        course = request.form.get('course')
-        address = request.form.get('address')
-
-        if not full_name or not email:
-            flash('Name and email are required.', 'danger')
-            return redirect(url_for('register'))
-
-        applicant = Applicant(
-            full_name=full_name.strip(),
-            email=email.strip(),
-            phone=phone.strip() if phone else None,
-            course=course.strip() if course else None,
-            address=address.strip() if address else None
+    form = RegisterForm()
+    if form.validate_on_submit():
+        values = dict(
+            full_name=form.full_name.data,
+            email=form.email.data,
+            phone=form.phone.data,
+            course=form.course.data,
+            address=form.address.data,
+            status='pending',
+            created_at=datetime.utcnow()
         )
-        db.session.add(applicant)
+        # Core INSERT: skips the ORM unit of work for this hot single-row write
+        result = db.session.execute(insert(Applicant).values(**values))
         db.session.commit()
+        applicant = SimpleNamespace(id=result.inserted_primary_key[0], admin_note=None, **values)
 
         # Send confirmation email (applicant)
-        html = render_template('email_template.html', applicant=applicant, action='received')
-        send_email(f'Application received — {applicant.full_name}', applicant.email, html)
+        html = EMAIL_TMPLS['received'].render(applicant=applicant)
+        enqueue(send_email_task, f'Application received — {applicant.full_name}', applicant.email, html)
 
         # Optionally send SMS
         if applicant.phone:
-            sms_body = f"Hi {applicant.full_name}, we received your application. ID: {applicant.id}"
-            send_sms(applicant.phone, sms_body)
+            enqueue(send_sms_task, applicant.phone, 'received', {'full_name': applicant.full_name, 'id': applicant.id})
 
         return render_template('register_success.html', applicant=applicant)
 
-    return render_template('register.html')
+    if request.method == 'POST':
+        for errors in form.errors.values():
+            flash(errors[0], 'danger')
+        return redirect(url_for('register'))
+
+    return render_template('register.html', form=form)
+
+# Admin (every /admin route is checked by one blueprint-level hook)
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+ADMIN_PUBLIC_ENDPOINTS = ('admin.login', 'admin.logout')
+
+@admin_bp.before_request
+def require_admin():
+    if request.endpoint not in ADMIN_PUBLIC_ENDPOINTS and not session.get('admin_logged_in'):
+        if request.endpoint == 'admin.api_applicants':
+            # API clients get an error they can handle, not the login page
+            abort(401)
+        flash('Please log in as admin.', 'warning')
+        return redirect(url_for('admin.login'))
 
 # Admin login (very basic)
-@app.route('/admin/login', methods=['GET', 'POST'])
-def admin_login():
+@admin_bp.route('/login', methods=['GET', 'POST'])
+def login():
     if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
-        if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
+        username = request.form.get('username', '')
+        password = request.form.get('password', '')
+        username_ok = hmac.compare_digest(username.encode(), ADMIN_USERNAME.encode())
+        password_ok = bcrypt.checkpw(password_digest(password), ADMIN_PASSWORD_HASH)
+        if username_ok and password_ok:
             session['admin_logged_in'] = True
             flash('Logged in as admin.', 'success')
-            return redirect(url_for('admin_dashboard'))
+            return redirect(url_for('admin.dashboard'))
         else:
             flash('Invalid credentials.', 'danger')
-            return redirect(url_for('admin_login'))
+            return redirect(url_for('admin.login'))
     return render_template('admin_login.html')
 
-@app.route('/admin/logout')
-def admin_logout():
+@admin_bp.route('/logout')
+def logout():
     session.pop('admin_logged_in', None)
     flash('Logged out.', 'info')
-    return redirect(url_for('admin_login'))
-
-def admin_required(f):
-    from functools import wraps
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if not session.get('admin_logged_in'):
-            flash('Please log in as admin.', 'warning')
-            return redirect(url_for('admin_login'))
-        return f(*args, **kwargs)
-    return decorated
-
-@app.route('/admin')
-@admin_required
-def admin_dashboard():
-    total = Applicant.query.count()
-    pending = Applicant.query.filter_by(status='pending').count()
-    approved = Applicant.query.filter_by(status='approved').count()
-    rejected = Applicant.query.filter_by(status='rejected').count()
+    return redirect(url_for('admin.login'))
+
+@admin_bp.route('')
+def dashboard():
+    counts = get_status_counts()
+    total = sum(counts.values())
+    pending = counts.get('pending', 0)
+    approved = counts.get('approved', 0)
+    rejected = counts.get('rejected', 0)
     return render_template('admin_dashboard.html', total=total, pending=pending, approved=approved, rejected=rejected)
 
-@app.route('/admin/pending')
-@admin_required
-def admin_pending_list():
-    applicants = Applicant.query.filter_by(status='pending').order_by(Applicant.created_at.asc()).all()
-    return render_template('admin_pending_list.html', applicants=applicants)
+@admin_bp.route('/pending')
+def pending_list():
+    page = request.args.get('page', 1, type=int)
+    pagination = Applicant.query.options(load_only(*ADMIN_LIST_COLUMNS, raiseload=True), raiseload('*')) \
+        .filter_by(status='pending').order_by(Applicant.created_at.asc()) \
+        .paginate(page=page, per_page=ADMIN_PAGE_SIZE, error_out=False)
+    return render_template('admin_pending_list.html', applicants=pagination.items, pagination=pagination)
 
-@app.route('/admin/approve/<int:applicant_id>', methods=['POST'])
-@admin_required
+@admin_bp.route('/approve/<int:applicant_id>', methods=['POST'])
 def approve_applicant(applicant_id):
     a = Applicant.query.get_or_404(applicant_id)
     a.status = 'approved'
     a.admin_note = request.form.get('admin_note', '')
     db.session.commit()
+    cache.delete_memoized(get_status_counts)
 
     # send approval email
-    html = render_template('email_template.html', applicant=a, action='approved')
-    send_email(f'Application approved — {a.full_name}', a.email, html)
+    html = EMAIL_TMPLS['approved'].render(applicant=a)
+    enqueue(send_email_task, f'Application approved — {a.full_name}', a.email, html)
 
     # send SMS
     if a.phone:
-        send_sms(a.phone, f"Congratulations {a.full_name}! Your application (ID:{a.id}) is approved.")
+        enqueue(send_sms_task, a.phone, 'approved', {'full_name': a.full_name, 'id': a.id})
 
     flash(f'Applicant {a.full_name} approved.', 'success')
-    return redirect(url_for('admin_pending_list'))
+    return redirect(url_for('admin.pending_list'))
 
-@app.route('/admin/reject/<int:applicant_id>', methods=['POST'])
-@admin_required
+@admin_bp.route('/reject/<int:applicant_id>', methods=['POST'])
 def reject_applicant(applicant_id):
     a = Applicant.query.get_or_404(applicant_id)
     a.status = 'rejected'
     a.admin_note = request.form.get('admin_note', '')
     db.session.commit()
+    cache.delete_memoized(get_status_counts)
 
     # send rejection email
-    html = render_template('email_template.html', applicant=a, action='rejected')
-    send_email(f'Application update — {a.full_name}', a.email, html)
+    html = EMAIL_TMPLS['rejected'].render(applicant=a)
+    enqueue(send_email_task, f'Application update — {a.full_name}', a.email, html)
 
     if a.phone:
-        send_sms(a.phone, f"Hello {a.full_name}, your application (ID:{a.id}) status: rejected.")
+        enqueue(send_sms_task, a.phone, 'rejected', {'full_name': a.full_name, 'id': a.id})
 
     flash(f'Applicant {a.full_name} rejected.', 'info')
-    return redirect(url_for('admin_pending_list'))
-
-@app.route('/admin/all')
-@admin_required
-def admin_all():
-    applicants = Applicant.query.order_by(Applicant.created_at.desc()).all()
-    return render_template('admin_pending_list.html', applicants=applicants, show_all=True)
-
-with app.app_context():
+    return redirect(url_for('admin.pending_list'))
+
+@admin_bp.route('/bulk_approve', methods=['POST'])
+def bulk_approve():
+    ids = request.form.getlist('ids', type=int)
+    if not ids:
+        flash('No applicants selected.', 'warning')
+        return redirect(url_for('admin.pending_list'))
+
+    # one UPDATE + one COMMIT for the whole selection; only rows still pending
+    # are approved, and only those get notified
+    stmt = update(Applicant) \
+        .where(Applicant.id.in_(ids), Applicant.status == 'pending') \
+        .values(status='approved', admin_note=request.form.get('admin_note', '')) \
+        .execution_options(synchronize_session=False)
+    if db.engine.dialect.update_returning:
+        ids = db.session.execute(stmt.returning(Applicant.id)).scalars().all()
+    else:
+        # no UPDATE ... RETURNING (MySQL): lock the pending rows first
+        ids = db.session.execute(select(Applicant.id)
+                                 .where(Applicant.id.in_(ids), Applicant.status == 'pending')
+                                 .with_for_update()).scalars().all()
+        db.session.execute(stmt)
+    db.session.commit()
+    cache.delete_memoized(get_status_counts)
+
+    applicants = Applicant.query.filter(Applicant.id.in_(ids)).all()
+    for a in applicants:
+        html = EMAIL_TMPLS['approved'].render(applicant=a)
+        enqueue(send_email_task, f'Application approved — {a.full_name}', a.email, html)
+        if a.phone:
+            enqueue(send_sms_task, a.phone, 'approved', {'full_name': a.full_name, 'id': a.id})
+
+    flash(f'{len(applicants)} applicant(s) approved.', 'success')
+    return redirect(url_for('admin.pending_list'))
+
+@admin_bp.route('/all')
+def all_applicants():
+    page = request.args.get('page', 1, type=int)
+    pagination = Applicant.query.options(load_only(*ADMIN_LIST_COLUMNS, Applicant.admin_note, raiseload=True), raiseload('*')) \
+        .order_by(Applicant.created_at.desc()) \
+        .paginate(page=page, per_page=ADMIN_PAGE_SIZE, error_out=False)
+    return render_template('admin_pending_list.html', applicants=pagination.items, pagination=pagination, show_all=True)
+
+@admin_bp.route('/api/applicants')
+def api_applicants():
+    status = request.args.get('status', 'pending')
+    page = request.args.get('page', 1, type=int)
+    query = Applicant.query.options(load_only(*ADMIN_LIST_COLUMNS, Applicant.admin_note, raiseload=True), raiseload('*'))
+    if status == 'pending':
+        query = query.filter_by(status='pending').order_by(Applicant.created_at.asc())
+    elif status in ('approved', 'rejected'):
+        query = query.filter_by(status=status).order_by(Applicant.created_at.desc())
+    elif status == 'all':
+        query = query.order_by(Applicant.created_at.desc())
+    else:
+        abort(400)
+    pagination = query.paginate(page=page, per_page=ADMIN_PAGE_SIZE, error_out=False)
+    return jsonify({
+        'items': [{
+            'id': a.id,
+            'full_name': a.full_name,
+            'email': a.email,
+            'phone': a.phone,
+            'course': a.course,
+            'status': a.status,
+            'created_at': a.created_at,
+            'admin_note': a.admin_note,
+        } for a in pagination.items],
+        'page': pagination.page,
+        'pages': pagination.pages,
+        'total': pagination.total,
+    })
+
+app.register_blueprint(admin_bp)
+
+# Create tables once per deploy: `flask --app app init-db`
+@app.cli.command('init-db')
+def init_db():
     db.create_all()
+    # create_all() skips existing tables, so add indexes introduced since
+    for index in Applicant.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    click.echo('Database initialized.')
 
 
 if __name__ == '__main__':
+    with app.app_context():
+        db.create_all()
     app.run(debug=True)